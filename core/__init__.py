@@ -1,5 +1,6 @@
 """clases principales de la Maquina de Turing de una cinta."""
 
+from .history import History                         # Historial de IDs como deltas
 from .instant_description import InstantDescription  # Estructura para snapshots (IDs)
 from .machine import Machine                         # simulador
 from .machine_config import MachineConfig            # Configuracion de la MT
@@ -7,6 +8,7 @@ from .state import State                             # Clase de estados
 from .transition import Transition                   # Transiciones que definen la logica
 
 __all__ = [
+    "History",
     "InstantDescription",
     "Machine",
     "MachineConfig",
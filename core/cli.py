@@ -1,27 +1,53 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Tuple
+import os
 import sys
 
+from history import History
 from instant_description import InstantDescription
 from machine import Machine
 from machine_config import MachineConfig
 from parser import Parser
 
+# Limite de pasos por cadena
+_MAX_STEPS = 10000
+
+# Maquina de cada proceso del pool (se construye una vez por proceso)
+_worker_machine: Machine | None = None
+
+
+def _init_worker(config: MachineConfig, max_steps: int) -> None:
+    """Construye la maquina (tabla de transiciones incluida) en el proceso del pool."""
+    global _worker_machine
+    _worker_machine = Machine(config, max_steps=max_steps)
+
+
+def _run_in_worker(input_string: str, record_history: bool) -> Tuple[History | None, bool]:
+    """Simula una cadena con la maquina del proceso."""
+    return _worker_machine.run(input_string, record_history=record_history)
+
 
 class TuringMachine:
     
-    def __init__(self) -> None:
+    def __init__(self, quiet: bool = False, parallel: bool = False) -> None:
         self.machine: Machine | None = None
         self.config: MachineConfig | None = None
+        # En modo quiet solo se muestra el veredicto de cada cadena (sin IDs)
+        self.quiet = quiet
+        # En modo parallel las cadenas se reparten entre procesos. Es opcional
+        # porque levantar el pool cuesta mas que simular cadenas cortas.
+        self.parallel = parallel
 
     def load_machine(self, filepath: str | Path) -> None:
 
         try:
             self.config = Parser.load_from_file(filepath)
-            self.machine = Machine(self.config, max_steps=10000)
+            self.machine = Machine(self.config, max_steps=_MAX_STEPS)
             
             print(f"Máquina cargada")
             print(f"   Estados: {len(self.config.states)}")
@@ -43,8 +69,22 @@ class TuringMachine:
             print("No hay inputs definidos en el archivo.")
             return
 
-        for idx, input_string in enumerate(self.config.inputs, 1):
-            self.run_single_input(input_string, idx)
+        inputs = self.config.inputs
+        if not self.parallel or len(inputs) < 2 or (os.cpu_count() or 1) < 2:
+            for idx, input_string in enumerate(inputs, 1):
+                self.run_single_input(input_string, idx)
+            return
+
+        # Las cadenas son independientes: las simulamos en paralelo y
+        # mostramos los resultados en orden.
+        with ProcessPoolExecutor(
+            initializer=_init_worker, initargs=(self.config, _MAX_STEPS)
+        ) as executor:
+            futures = [
+                executor.submit(_run_in_worker, s, not self.quiet) for s in inputs
+            ]
+            for idx, (input_string, future) in enumerate(zip(inputs, futures), 1):
+                self._print_run(input_string, idx, future.result)
 
     def run_single_input(self, input_string: str, index: int | None = None) -> None:
         
@@ -52,16 +92,27 @@ class TuringMachine:
             print("Primero debes cargar una máquina.")
             return
 
+        run = partial(self.machine.run, input_string, record_history=not self.quiet)
+        self._print_run(input_string, index, run)
+
+    def _print_run(
+        self,
+        input_string: str,
+        index: int | None,
+        run: Callable[[], Tuple[History | None, bool]],
+    ) -> None:
+
         header = f"Cadena #{index}" if index else "Cadena"
         print(f"\n{'-'*60}")
         print(f"{header}: \"{input_string}\"")
         print(f"{'-'*60}")
 
         try:
-            history, accepted = self.machine.run(input_string)
+            history, accepted = run()
             
-            print("\nIDs:\n")
-            self._display_instant_descriptions(history)
+            if history is not None:
+                print("\nIDs:\n")
+                self._display_instant_descriptions(history)
             
             print(f"\n{'─'*60}")
             if accepted:
@@ -73,26 +124,23 @@ class TuringMachine:
         except Exception as e:
             print(f"Error durante la ejecución: {e}")
 
-    def _display_instant_descriptions(self, history: List[InstantDescription]) -> None:
+    def _display_instant_descriptions(self, history: Iterable[InstantDescription]) -> None:
         
-        for idx, id_snapshot in enumerate(history):
-            tape_visual = self._format_tape_with_head(
-                id_snapshot.tape, 
-                id_snapshot.head_position
-            )
-            
-            print(f"{id_snapshot.state:>4s} | {tape_visual}")
+        # writelines con un generador: sin un print por linea y sin juntar
+        # toda la traza en memoria
+        format_tape = self._format_tape_with_head
+        sys.stdout.writelines(
+            f"{id_snapshot.state:>4s} | "
+            f"{format_tape(id_snapshot.tape, id_snapshot.head_position)}\n"
+            for id_snapshot in history
+        )
 
     def _format_tape_with_head(self, tape: str, head_position: int) -> str:
        
         if not tape or head_position < 0 or head_position >= len(tape):
             return tape
 
-        before = tape[:head_position]
-        symbol = tape[head_position]
-        after = tape[head_position + 1:]
-        
-        return f"{before}[{symbol}]{after}"
+        return f"{tape[:head_position]}[{tape[head_position]}]{tape[head_position + 1:]}"
 
 
 def main() -> None:
@@ -102,8 +150,10 @@ def main() -> None:
         sys.exit(1)
 
     filepath = sys.argv[1]
+    quiet = "--quiet" in sys.argv[2:]
+    parallel = "--parallel" in sys.argv[2:]
     
-    cli = TuringMachine()
+    cli = TuringMachine(quiet=quiet, parallel=parallel)
     
     try:
         cli.load_machine(filepath)
@@ -0,0 +1,82 @@
+"""Historial de descripciones instantaneas de una corrida de la Maquina de Turing."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Union
+
+from instant_description import InstantDescription
+
+
+@dataclass(frozen=True, slots=True)
+class History:
+    """
+    Historial de IDs guardado como deltas en vez de una cinta completa por paso.
+
+    Contiene:
+        - initial_tape: ids de simbolos de la cinta inicial (sin padding)
+        - states: id del estado en cada configuracion
+        - heads: posicion del cabezal relativa a la primera celda del input
+        - writes: id del simbolo escrito en cada paso (uno menos que states)
+
+    Las InstantDescription se construyen una por una al iterar, asi la memoria
+    es O(pasos) y no O(pasos * cinta).
+    """
+
+    initial_tape: Union[bytes, array]    # Cinta inicial como ids de simbolos
+    states: List[int]                    # Id del estado en cada configuracion
+    heads: List[int]                     # Cabezal en cada configuracion (puede ser negativo)
+    writes: List[int]                    # Simbolo escrito en cada paso
+    state_names: List[str]               # state_names[state_id] -> nombre del estado
+    symbols: List[str]                   # symbols[symbol_id] -> simbolo
+    blank_id: int                        # Id del simbolo blank
+    decode_table: Optional[bytes]        # Tabla para translate si los simbolos son de un caracter
+
+    def __len__(self) -> int:
+        """Cantidad de IDs (configuraciones) registradas."""
+        return len(self.states)
+
+    def __iter__(self) -> Iterator[InstantDescription]:
+        """
+        Genera las InstantDescription en orden.
+
+        Se recorre la corrida hacia adelante sobre una sola cinta de trabajo:
+        en cada paso se aplica la escritura del paso anterior y la parte usada
+        crece cuando el cabezal pasa por una celda nueva. La conversion de la
+        cinta a string va dentro del loop (sin llamar a un metodo por ID); con
+        alfabetos de un caracter es un translate + decode en C.
+        """
+        states, heads, writes = self.states, self.heads, self.writes
+        state_names, symbols, decode_table = self.state_names, self.symbols, self.decode_table
+
+        # Reservamos de una vez todas las celdas que el cabezal llego a visitar
+        offset = max(0, -min(heads))
+        right = max(0, max(heads) + 1 - len(self.initial_tape))
+        if isinstance(self.initial_tape, array):
+            blank = array(self.initial_tape.typecode, (self.blank_id,))
+        else:
+            blank = bytearray((self.blank_id,))
+        tape = blank * offset + self.initial_tape + blank * right
+        used_start = offset
+        used_end = offset + len(self.initial_tape)
+
+        for step in range(len(states)):
+            if step:
+                tape[offset + heads[step - 1]] = writes[step - 1]
+            head_index = offset + heads[step]
+            if head_index < used_start:
+                used_start = head_index
+            elif head_index >= used_end:
+                used_end = head_index + 1
+
+            used = tape[used_start:used_end]
+            if decode_table is not None:
+                tape_str = used.translate(decode_table).decode("latin-1")
+            else:
+                tape_str = "".join([symbols[symbol_id] for symbol_id in used])
+            yield InstantDescription(
+                state=state_names[states[step]],
+                tape=tape_str,
+                head_position=head_index - used_start,
+            )
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass  
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class InstantDescription:
     """
     Estructura de solo lectura que describe una configuracion de la maquina.
@@ -21,10 +21,11 @@ class InstantDescription:
     head_position: int  # Posicion (indice) del cabezal sobre la cinta
 
     def __post_init__(self) -> None:  
-        """Validaciones basicas ."""
-        if not isinstance(self.state, str) or self.state == "":
-            raise ValueError("state must be a non-empty string.")
-        if not isinstance(self.tape, str):
-            raise ValueError("tape must be a string representation.")
-        if not isinstance(self.head_position, int) or self.head_position < 0:
-            raise ValueError("head_position must be a non-negative integer index.")
\ No newline at end of file
+        """Validaciones basicas (se omiten con python -O)."""
+        if __debug__:
+            if not isinstance(self.state, str) or self.state == "":
+                raise ValueError("state must be a non-empty string.")
+            if not isinstance(self.tape, str):
+                raise ValueError("tape must be a string representation.")
+            if not isinstance(self.head_position, int) or self.head_position < 0:
+                raise ValueError("head_position must be a non-negative integer index.")
\ No newline at end of file
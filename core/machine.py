@@ -2,13 +2,40 @@
 
 from __future__ import annotations 
 
-from typing import Dict, Iterable, List, Optional, Tuple  
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union  
 
-from instant_description import InstantDescription  # Representa cada paso (ID)
+from history import History                         # Historial de IDs como deltas
 from machine_config import MachineConfig            # Configuracion completa de la MT
 from state import State                             # Clase para modelar estados internamente
 from transition import Transition                   # Transiciones 
 
+# Desplazamiento del cabezal para cada movimiento
+_MOVE_DELTAS = {"L": -1, "R": 1, "S": 0}
+
+# Celdas blank que se reservan a cada lado del input al crear la cinta.
+# Al salirse del buffer se crece al menos esta cantidad (o el doble del buffer),
+# para que extender la cinta sea O(1) amortizado en ambos lados.
+_TAPE_PADDING = 64
+
+# Limites para generar un loop especializado por maquina. Cada paso recorre
+# la cadena de if/elif del estado actual, asi que importa cuantas
+# transiciones tiene cada estado: con mas de unas 8 la tabla densa gana.
+_CODEGEN_MAX_STATES = 32
+_CODEGEN_MAX_TRANSITIONS_PER_STATE = 8
+
+# La cinta guarda ids de simbolos: bytearray si caben en un byte (hasta 256
+# simbolos), si no un array de enteros sin signo de 16 bits
+Tape = Union[bytearray, array]
+_WIDE_TAPE_TYPECODE = "H"
+_MAX_WIDE_SYMBOLS = 1 << 16
+
+# Resultado de un loop de simulacion: (aceptada, estados, cabezales, escrituras)
+RunResult = Tuple[bool, List[int], List[int], List[int]]
+
+# Loop generado por maquina: (cinta, cabezal, estado, max_steps) -> RunResult
+SpecializedCore = Callable[[Tape, int, int, Optional[int]], RunResult]
+
 
 class Machine:
     """
@@ -28,103 +55,180 @@ class Machine:
         # Creamos objetos State para cada nombre de estado
         self._states: Dict[str, State] = {name: State(name) for name in config.states}
 
+        # Cada estado se identifica por un entero (su posicion en la lista)
+        self._state_names: List[str] = list(self._states)
+        self._state_index: Dict[str, int] = {
+            name: idx for idx, name in enumerate(self._state_names)
+        }
+
+        # Alfabeto de entrada como frozenset para validar inputs sin reconstruirlo
+        self._input_alphabet_set = frozenset(config.input_alphabet)
+
         # Conjunto de estados de aceptacion 
         self._accept_states = set(config.accept_states)
 
+        # accept_mask[state_id] indica si el estado es de aceptacion
+        self._accept_mask: List[bool] = [
+            name in self._accept_states for name in self._state_names
+        ]
+
         # Simbolo blank de la cinta
         self._blank_symbol = config.blank_symbol
 
+        # Cada simbolo de la cinta se identifica por un entero 0..A-1 y la cinta
+        # guarda esos ids en un bytearray (o en un array de 16 bits si hay mas
+        # de 256 simbolos). Se incluyen tambien simbolos que solo aparecen en
+        # transiciones para no cambiar el comportamiento.
+        self._symbols: List[str] = list(
+            dict.fromkeys(
+                [*config.tape_alphabet]
+                + [t.read_symbol for t in config.transitions]
+                + [t.write_symbol for t in config.transitions]
+            )
+        )
+        if len(self._symbols) > _MAX_WIDE_SYMBOLS:
+            raise ValueError(
+                f"tape_alphabet can have at most {_MAX_WIDE_SYMBOLS} symbols."
+            )
+        self._wide_tape = len(self._symbols) > 256
+        self._symbol_index: Dict[str, int] = {
+            symbol: idx for idx, symbol in enumerate(self._symbols)
+        }
+        self._blank_id = self._symbol_index[self._blank_symbol]
+
+        # Si todos los simbolos son de un caracter latin-1, la conversion
+        # simbolo <-> id es un solo translate en C en ambos sentidos:
+        #   - encode_table[ord(simbolo)] -> id (para cargar el input)
+        #   - decode_table[id] -> ord(simbolo) (para los snapshots)
+        # Si no, se usa el diccionario y join.
+        self._encode_table: Optional[bytes] = None
+        self._decode_table: Optional[bytes] = None
+        if all(len(symbol) == 1 and ord(symbol) < 256 for symbol in self._symbols):
+            encode_table = bytearray(256)
+            decode_table = bytearray(256)
+            for idx, symbol in enumerate(self._symbols):
+                encode_table[ord(symbol)] = idx
+                decode_table[idx] = ord(symbol)
+            self._encode_table = bytes(encode_table)
+            self._decode_table = bytes(decode_table)
+
         # Limite opcional de pasos
         self._max_steps = max_steps
 
-        # Diccionario (estado, simbolo) -> Transition
+        # Diccionario anidado estado -> simbolo -> Transition
         self._transition_map = self._build_transition_map(config.transitions)
 
-    def run(self, input_string: str) -> tuple[list[InstantDescription], bool]:
+        # Tabla densa: table[state_id * A + symbol_id] -> Transition o None
+        self._table = self._build_transition_table()
+
+        # Arreglos paralelos a la tabla para que el loop no toque los objetos Transition.
+        # next_state_ids vale -1 cuando no hay transicion (la maquina rechaza).
+        self._next_state_ids: List[int] = [
+            -1 if t is None else self._state_index[t.next_state] for t in self._table
+        ]
+        self._write_symbol_ids: List[int] = [
+            0 if t is None else self._symbol_index[t.write_symbol] for t in self._table
+        ]
+        self._move_deltas: List[int] = [
+            0 if t is None else _MOVE_DELTAS[t.move] for t in self._table
+        ]
+
+        # Loops generados para esta maquina, por valor de record_history.
+        # Se compilan recien en el primer run que los usa (None si la maquina
+        # es demasiado grande para generarlo).
+        self._specialized_cores: Dict[bool, Optional[SpecializedCore]] = {}
+
+    def run(
+        self, input_string: str, *, record_history: bool = True
+    ) -> tuple[Optional[History], bool]:
         """
         Simula la maquina sobre la cadena de entrada dada.
 
+        La simulacion la hace _run_core sobre enteros; aqui solo se prepara la
+        cinta y se empaqueta lo que registro en un History.
+
+        Parametros:
+            input_string: cadena de entrada.
+            record_history: si es False no se registra nada por paso y solo
+                se calcula si la cadena es aceptada.
+
         Retorna:
-            - lista de InstantDescription 
+            - History, que genera las InstantDescription al iterarlo
+              (None si record_history es False)
             - booleano que indica si la cadena fue aceptada (True) o rechazada (False)
         """
         # Validamos que el input solo use simbolos del alfabeto de entrada
         self._validate_input_string(input_string)
 
-        # Inicializamos la cinta a partir del input
-        tape = self._initialize_tape(input_string)
+        # Inicializamos la cinta a partir del input.
+        # La parte usada de la cinta es tape[used_start:used_end]; el resto es padding.
+        tape, used_start, used_end = self._initialize_tape(input_string)
 
-        # El cabezal siempre empieza en la posicion 0
-        head_index = 0
+        # Guardamos la cinta inicial (sin padding) para reconstruir los IDs
+        initial_tape = tape[used_start:used_end]
+        if not self._wide_tape:
+            initial_tape = bytes(initial_tape)
 
-        # Estado inicial viene de la configuracion
-        current_state = self._config.initial_state
+        # El cabezal siempre empieza en la primera celda del input
+        head_index = used_start
+        state_id = self._state_index[self._config.initial_state]
 
-        # Historial de IDs
-        history: list[InstantDescription] = [self._snapshot(current_state, tape, head_index)]
-
-        # Caso borde: si el estado inicial ya es de aceptacion, devolvemos de una vez
-        if current_state in self._accept_states:
-            return history, True
-
-        steps = 0  # Contador de pasos para controlar loops
-        while True:
-            # Simbolo actual bajo el cabezal
-            symbol = tape[head_index]
-
-            # Buscamos la transicion (estado, simbolo) en el diccionario
-            transition = self._transition_map.get((current_state, symbol))
-
-            # Si no hay transicion definida, la maquina se detiene y rechaza
-            if transition is None:
-                return history, False
-
-            # Aplicamos la transicion:
-            # 1. Escribimos en la cinta
-            tape[head_index] = transition.write_symbol
-
-            # 2. Cambiamos de estado
-            current_state = transition.next_state
-
-            # 3. Movemos el cabezal (y expandimos cinta si es necesario)
-            head_index = self._move_head(head_index, transition.move, tape)
-
-            # Aumentamos contador de pasos
-            steps += 1
-
-            # Guardamos snapshot de la nueva configuracion
-            history.append(self._snapshot(current_state, tape, head_index))
-
-            # Si llegamos a un estado de aceptacion, devolvemos aceptado
-            if current_state in self._accept_states:
-                return history, True
+        specialized_core = self._specialized_core(record_history)
+        if specialized_core is not None:
+            accepted, states, heads, writes = specialized_core(
+                tape, head_index, state_id, self._max_steps
+            )
+        else:
+            accepted, states, heads, writes = _run_core(
+                tape,
+                head_index,
+                state_id,
+                self._next_state_ids,
+                self._write_symbol_ids,
+                self._move_deltas,
+                self._accept_mask,
+                len(self._symbols),
+                self._blank_padding(1),
+                self._max_steps,
+                record_history,
+            )
 
-            # Si se alcanzo el maximo de pasos configurado, paramos
-            if self._max_steps is not None and steps >= self._max_steps:
-                # Aqui devolvemos aceptado solo si ya esta en estado de aceptacion
-                return history, current_state in self._accept_states
+        if not record_history:
+            return None, accepted
+
+        history = History(
+            initial_tape=initial_tape,
+            states=states,
+            heads=heads,
+            writes=writes,
+            state_names=self._state_names,
+            symbols=self._symbols,
+            blank_id=self._blank_id,
+            decode_table=self._decode_table,
+        )
+        return history, accepted
+
+    def accepts(self, input_string: str) -> bool:
+        """
+        Indica si la maquina acepta la cadena, sin registrar el historial de IDs.
+        """
+        return self.run(input_string, record_history=False)[1]
 
     def _build_transition_map(
         self, transitions: Iterable[Transition]
-    ) -> Dict[Tuple[str, str], Transition]:
+    ) -> Dict[str, Dict[str, Transition]]:
         """
-        Construye el diccionario (estado, simbolo) -> Transition.
+        Construye el diccionario anidado estado -> simbolo -> Transition.
+
+        Anidado en vez de llave (estado, simbolo) para no crear una tupla por
+        busqueda y poder recorrer las transiciones de un estado directamente.
 
         Ademas valida:
             - No haya transiciones duplicadas para el mismo par (estado, simbolo).
             - Todas las transiciones apunten a estados definidos.
         """
-        transition_map: Dict[Tuple[str, str], Transition] = {}
+        transition_map: Dict[str, Dict[str, Transition]] = {}
         for transition in transitions:
-            key = transition.signature()
-
-            # Una transicion por cada (estado, simbolo) para que sea determinista
-            if key in transition_map:
-                raise ValueError(
-                    "Duplicate transition detected for state/symbol pair "
-                    f"{key}. Deterministic machine requires unique transitions."
-                )
-
             # Validamos que el estado de origen exista
             if transition.current_state not in self._states:
                 raise ValueError(
@@ -137,63 +241,284 @@ class Machine:
                     f"Transition jumps to undefined state '{transition.next_state}'."
                 )
 
-            transition_map[key] = transition
+            by_symbol = transition_map.setdefault(transition.current_state, {})
+
+            # Una transicion por cada (estado, simbolo) para que sea determinista
+            if transition.read_symbol in by_symbol:
+                raise ValueError(
+                    "Duplicate transition detected for state/symbol pair "
+                    f"{transition.signature()}. Deterministic machine requires unique transitions."
+                )
+
+            by_symbol[transition.read_symbol] = transition
 
         return transition_map
 
+    def _build_transition_table(self) -> List[Optional[Transition]]:
+        """
+        Construye la tabla densa table[state_id * A + symbol_id] -> Transition.
+
+        Las posiciones sin transicion quedan en None.
+        """
+        num_symbols = len(self._symbols)
+        table: List[Optional[Transition]] = [None] * (len(self._state_names) * num_symbols)
+        for state, by_symbol in self._transition_map.items():
+            base = self._state_index[state] * num_symbols
+            for symbol, transition in by_symbol.items():
+                table[base + self._symbol_index[symbol]] = transition
+        return table
+
+    def _specialized_core(self, record_history: bool) -> Optional[SpecializedCore]:
+        """
+        Devuelve el loop generado para record_history, compilandolo la primera vez.
+        """
+        if record_history not in self._specialized_cores:
+            self._specialized_cores[record_history] = self._build_specialized_core(
+                record_history=record_history
+            )
+        return self._specialized_cores[record_history]
+
+    def _build_specialized_core(
+        self, *, record_history: bool
+    ) -> Optional[SpecializedCore]:
+        """
+        Genera y compila un loop de simulacion especializado para esta maquina.
+
+        Hace lo mismo que _run_core, pero cada (estado, simbolo) -> (escribir,
+        mover, siguiente) queda como una rama if/elif con constantes:
+            - cada estado tiene su propio loop, asi las transiciones que vuelven
+              al mismo estado (barridos de la cinta) no pasan por el despacho;
+            - el chequeo de bordes solo se emite en la direccion del movimiento;
+            - si el siguiente estado es de aceptacion se sabe al generar el codigo.
+
+        Con record_history=False no se emite el registro de cada paso.
+        """
+        if len(self._state_names) > _CODEGEN_MAX_STATES:
+            return None
+        if any(
+            len(by_symbol) > _CODEGEN_MAX_TRANSITIONS_PER_STATE
+            for by_symbol in self._transition_map.values()
+        ):
+            return None
+
+        reject = "return False, states, heads, writes"
+        lines = [
+            "def _run_specialized(tape, head_index, state_id, max_steps):",
+            "    origin = head_index",
+            "    states = [state_id]",
+            "    heads = [0]",
+            "    writes = []",
+            "    if accept_mask[state_id]:",
+            "        return True, states, heads, writes",
+            "    states_append = states.append",
+            "    heads_append = heads.append",
+            "    writes_append = writes.append",
+            # steps vale al menos 1 al compararse: un max_steps <= 0 corta tras el
+            # primer paso, igual que el "steps >= max_steps" de _run_core
+            "    limit = 0 if max_steps is None else max(1, max_steps)",
+            "    steps = 0",
+            "    while True:",
+        ]
+        state_keyword = "if"
+        for state_id, state in enumerate(self._state_names):
+            # Los estados de aceptacion no tienen loop: la corrida termina al llegar
+            if self._accept_mask[state_id]:
+                continue
+            lines.append(f"        {state_keyword} state_id == {state_id}:")
+            lines.append("            while True:")
+            lines.append("                symbol_id = tape[head_index]")
+            state_keyword = "elif"
+            symbol_keyword = "if"
+            # Solo las transiciones definidas para este estado
+            for symbol, transition in self._transition_map.get(state, {}).items():
+                symbol_id = self._symbol_index[symbol]
+                next_state_id = self._state_index[transition.next_state]
+                write_id = self._symbol_index[transition.write_symbol]
+                delta = _MOVE_DELTAS[transition.move]
+                accepting = self._accept_mask[next_state_id]
+                lines.append(f"                {symbol_keyword} symbol_id == {symbol_id}:")
+                symbol_keyword = "elif"
+                body = [f"tape[head_index] = {write_id}"]
+                if delta < 0:
+                    body += [
+                        "head_index -= 1",
+                        "if head_index < 0:",
+                        f"    grow = max({_TAPE_PADDING}, len(tape))",
+                        "    tape[:0] = blank_cell * grow",
+                        "    head_index += grow",
+                        "    origin += grow",
+                    ]
+                elif delta > 0:
+                    body += [
+                        "head_index += 1",
+                        "if head_index == len(tape):",
+                        f"    tape.extend(blank_cell * max({_TAPE_PADDING}, len(tape)))",
+                    ]
+                body.append("steps += 1")
+                if record_history:
+                    body += [
+                        f"states_append({next_state_id})",
+                        "heads_append(head_index - origin)",
+                        f"writes_append({write_id})",
+                    ]
+                if accepting:
+                    body.append("return True, states, heads, writes")
+                else:
+                    body += ["if steps == limit:", f"    {reject}"]
+                    if next_state_id == state_id:
+                        body.append("continue")
+                    else:
+                        body += [f"state_id = {next_state_id}", "break"]
+                lines += [f"                    {line}" for line in body]
+            if symbol_keyword == "if":
+                # Estado sin transiciones: siempre rechaza
+                lines.append(f"                {reject}")
+            else:
+                lines.append("                else:")
+                lines.append(f"                    {reject}")
+        if state_keyword == "if":
+            lines.append(f"        {reject}")
+        else:
+            lines.append("        else:")
+            lines.append(f"            {reject}")
+
+        namespace = {
+            "accept_mask": tuple(self._accept_mask),
+            "blank_cell": self._blank_padding(1),
+        }
+        exec(compile("\n".join(lines), "<tm_specialized>", "exec"), namespace)
+        return namespace["_run_specialized"]
+
     def _validate_input_string(self, input_string: str) -> None:
         """
         Verifica que todos los simbolos del input esten en el alfabeto de entrada.
         """
-        tape_symbols = set(self._config.input_alphabet)
-        invalid_symbols = [ch for ch in input_string if ch not in tape_symbols]
+        # Una sola diferencia de conjuntos en C; en el caso valido queda vacia
+        invalid_symbols = set(input_string) - self._input_alphabet_set
         if invalid_symbols:
             raise ValueError(
                 "Input string contains symbols outside the input alphabet: "
-                + ", ".join(sorted(set(invalid_symbols)))
+                + ", ".join(sorted(invalid_symbols))
             )
 
-    def _initialize_tape(self, input_string: str) -> List[str]:
+    def _initialize_tape(self, input_string: str) -> Tuple[Tape, int, int]:
         """
-        Inicializa la cinta como lista de simbolos.
+        Inicializa la cinta como bytearray (o array de 16 bits) de ids de simbolos.
 
+        El input queda centrado entre _TAPE_PADDING blanks a cada lado.
+        Retorna la cinta y los limites [used_start, used_end) de la parte usada.
         Si la cadena esta vacia, se coloca un unico blank.
         """
         if not input_string:
-            return [self._blank_symbol]
-        return list(input_string)
-
-    def _move_head(self, head_index: int, move: str, tape: List[str]) -> int:
+            # Una sola celda blank, aunque el simbolo blank tenga varios caracteres
+            cells = self._blank_padding(1)
+        elif self._encode_table is not None:
+            # El input ya fue validado, asi que todos sus caracteres son latin-1
+            cells = input_string.encode("latin-1").translate(self._encode_table)
+        else:
+            symbol_index = self._symbol_index
+            cells = self._cells([symbol_index[ch] for ch in input_string])
+        padding = self._blank_padding(_TAPE_PADDING)
+        return padding + cells + padding, _TAPE_PADDING, _TAPE_PADDING + len(cells)
+
+    def _blank_padding(self, size: int) -> Tape:
         """
-        Mueve el cabezal a la izquierda, derecha o lo deja.
+        Crea un bloque de `size` celdas blank.
+        """
+        return self._cells((self._blank_id,)) * size
 
-        Si nos salimos de la cinta, la expandimos con simbolos blanks.
+    def _cells(self, symbol_ids: Iterable[int]) -> Tape:
+        """
+        Crea un bloque de cinta con los ids dados, del tipo que usa esta maquina.
         """
-        if move == "L":
-            # Si estamos al borde izquierdo y nos movemos a la izquierda,
-            # insertamos un blank al inicio.
-            if head_index == 0:
-                tape.insert(0, self._blank_symbol)
-                return 0
-            return head_index - 1
+        if self._wide_tape:
+            return array(_WIDE_TAPE_TYPECODE, symbol_ids)
+        return bytearray(symbol_ids)
+
+
+def _run_core(
+    tape: Tape,
+    head_index: int,
+    state_id: int,
+    next_state_ids: List[int],
+    write_symbol_ids: List[int],
+    move_deltas: List[int],
+    accept_mask: List[bool],
+    num_symbols: int,
+    blank_cell: Tape,
+    max_steps: Optional[int],
+    record_history: bool = True,
+) -> RunResult:
+    """
+    Loop principal de la simulacion, solo con enteros, listas y la cinta.
 
-        if move == "R":
-            head_index += 1
-            # Si nos movemos una posicion mas alla del final, agregamos un blank.
-            if head_index == len(tape):
-                tape.append(self._blank_symbol)
-            return head_index
+    blank_cell es una celda blank del mismo tipo que la cinta (para agrandarla).
 
-        # 'S' (Stay) -> no movemos el cabezal
-        return head_index
+    No usa objetos de la maquina, asi que es facil de compilar (Numba/Cython)
+    si algun dia hace falta. Por cada configuracion registra el id del estado
+    y la posicion del cabezal relativa a la primera celda del input; por cada
+    paso registra el simbolo escrito. Con eso se reconstruye cualquier ID.
+    Con record_history=False no registra nada (las listas quedan con la
+    configuracion inicial).
 
-    def _snapshot(
-        self, current_state: str, tape: List[str], head_index: int
-    ) -> InstantDescription:
-        """
-        Construye una InstantDescription a partir del estado interno actual.
-
-        Convierte la cinta a string y guarda la posicion del cabezal.
-        """
-        tape_str = "".join(tape)
-        return InstantDescription(state=current_state, tape=tape_str, head_position=head_index)
\ No newline at end of file
+    Retorna (aceptada, estados, cabezales, escrituras).
+    """
+    origin = head_index  # Indice en el buffer de la primera celda del input
+    states = [state_id]
+    heads = [0]
+    writes: List[int] = []
+
+    # Caso borde: si el estado inicial ya es de aceptacion, devolvemos de una vez
+    if accept_mask[state_id]:
+        return True, states, heads, writes
+
+    states_append = states.append
+    heads_append = heads.append
+    writes_append = writes.append
+
+    steps = 0  # Contador de pasos para controlar loops
+    while True:
+        # Posicion en la tabla para (estado actual, simbolo bajo el cabezal)
+        idx = state_id * num_symbols + tape[head_index]
+
+        # Si no hay transicion definida, la maquina se detiene y rechaza
+        next_state_id = next_state_ids[idx]
+        if next_state_id < 0:
+            return False, states, heads, writes
+
+        # Aplicamos la transicion:
+        # 1. Escribimos en la cinta
+        write_id = write_symbol_ids[idx]
+        tape[head_index] = write_id
+
+        # 2. Cambiamos de estado
+        state_id = next_state_id
+
+        # 3. Movemos el cabezal (-1, +1 o 0). Solo en los bordes del buffer hay
+        #    que agrandarlo, por bloques (O(1) amortizado en ambos lados).
+        head_index += move_deltas[idx]
+        if head_index < 0:
+            grow = max(_TAPE_PADDING, len(tape))
+            tape[:0] = blank_cell * grow
+            head_index += grow
+            origin += grow
+        elif head_index == len(tape):
+            tape.extend(blank_cell * max(_TAPE_PADDING, len(tape)))
+
+        # Aumentamos contador de pasos
+        steps += 1
+
+        # Registramos la nueva configuracion
+        if record_history:
+            states_append(state_id)
+            heads_append(head_index - origin)
+            writes_append(write_id)
+
+        # Si llegamos a un estado de aceptacion, devolvemos aceptado
+        if accept_mask[state_id]:
+            return True, states, heads, writes
+
+        # Si se alcanzo el maximo de pasos configurado, paramos
+        if max_steps is not None and steps >= max_steps:
+            # Aqui devolvemos aceptado solo si ya esta en estado de aceptacion
+            return accept_mask[state_id], states, heads, writes
@@ -40,13 +40,16 @@ class MachineConfig:
         self.states = _copy_str_list(self.states, "states")
         if not self.states:
             raise ValueError("Configuration must define at least one state.")
+        # Conjunto de estados para validar con busquedas O(1)
+        states_set = set(self.states)
 
         # Normalizamos alfabetos
         self.input_alphabet = _copy_str_list(self.input_alphabet, "input_alphabet")
         self.tape_alphabet = _copy_str_list(self.tape_alphabet, "tape_alphabet")
+        tape_symbols = set(self.tape_alphabet)
 
         # input_alphabet debe ser subconjunto del alfabeto de la cinta
-        if not set(self.input_alphabet).issubset(set(self.tape_alphabet)):
+        if not tape_symbols.issuperset(self.input_alphabet):
             raise ValueError("input_alphabet must be a subset of tape_alphabet.")
 
         # Normalizamos estados de aceptacion
@@ -55,16 +58,15 @@ class MachineConfig:
         # Validamos estado inicial
         if not isinstance(self.initial_state, str) or self.initial_state == "":
             raise ValueError("initial_state must be a non-empty string.")
-        if self.initial_state not in self.states:
+        if self.initial_state not in states_set:
             raise ValueError("initial_state must belong to states list.")
 
         # Validamos que todos los estados de aceptacion existan
-        missing_accept = [s for s in self.accept_states if s not in self.states]
+        missing_accept = [s for s in self.accept_states if s not in states_set]
         if missing_accept:
             raise ValueError(f"accept_states {missing_accept} must belong to states list.")
 
         # Validamos que el simbolo blank exista en el alfabeto de cinta
-        tape_symbols = set(self.tape_alphabet)
         if self.blank_symbol not in tape_symbols:
             raise ValueError("blank_symbol must be part of tape_alphabet.")
 
@@ -12,16 +12,20 @@ def main():
     if len(sys.argv) < 2:
         print("Error: Debes proporcionar un archivo YAML")
         print("\nUso:")
-        print("  python main.py <archivo_yaml>")
+        print("  python main.py <archivo_yaml> [--quiet] [--parallel]")
+        print("\n  --quiet: solo muestra si cada cadena es aceptada o rechazada")
+        print("  --parallel: simula las cadenas en varios procesos (para cadenas largas)")
         sys.exit(1)
     
     filepath = sys.argv[1]
+    quiet = "--quiet" in sys.argv[2:]
+    parallel = "--parallel" in sys.argv[2:]
     
     if not Path(filepath).exists():
         print(f"Error: No se encuentra el archivo '{filepath}'")
         sys.exit(1)
     
-    cli = TuringMachine()
+    cli = TuringMachine(quiet=quiet, parallel=parallel)
     
     try:
         cli.load_machine(filepath)
@@ -1,14 +1,24 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set, Tuple
 
 import yaml
 
+# Usamos el loader en C (libyaml) si pyyaml fue compilado con soporte para libyaml
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 from machine_config import MachineConfig
 from transition import Transition
 
+_REQUIRED_TRANSITION_KEYS = frozenset({"state", "read", "write", "move", "next"})
+
 
 class Parser:
     
@@ -19,8 +29,18 @@ class Parser:
         if not path.exists():
             raise FileNotFoundError(f"No se encontró el archivo: {filepath}")
 
+        # La cache usa la ruta absoluta y la fecha de modificacion como llave,
+        # asi un archivo editado se vuelve a parsear.
+        cached = _load_cached(str(path.resolve()), path.stat().st_mtime_ns)
+        # Cada llamada recibe su propia copia: replace vuelve a pasar por
+        # __post_init__, que clona las listas. Las Transition son inmutables.
+        return replace(cached, transitions=list(cached.transitions))
+
+    @staticmethod
+    def _load_uncached(path: Path) -> MachineConfig:
+
         with open(path, "r", encoding="utf-8") as file:
-            data = yaml.safe_load(file)
+            data = yaml.load(file, Loader=_Loader)
 
         if not isinstance(data, dict):
             raise ValueError("El archivo YAML debe contener un diccionario.")
@@ -42,7 +62,7 @@ class Parser:
             "accept_states",
             "transitions",
         }
-        missing_keys = required_keys - set(mt_data.keys())
+        missing_keys = required_keys.difference(mt_data)
         if missing_keys:
             raise ValueError(f"Faltan claves requeridas en 'mt': {missing_keys}")
 
@@ -68,15 +88,15 @@ class Parser:
             raise ValueError("'transitions' debe ser una lista.")
 
         transitions: List[Transition] = []
+        seen: Set[Tuple[str, str]] = set()
 
         for idx, trans_dict in enumerate(transitions_data):
             if not isinstance(trans_dict, dict):
                 raise ValueError(f"La transición #{idx} debe ser un diccionario.")
 
-            required = {"state", "read", "write", "move", "next"}
-            if not required.issubset(trans_dict.keys()):
-                missing = required - set(trans_dict.keys())
-                raise ValueError(f"La transición #{idx} no tiene las claves: {missing}")
+            missing = _REQUIRED_TRANSITION_KEYS.difference(trans_dict)
+            if missing:
+                raise ValueError(f"La transición #{idx} no tiene las claves: {set(missing)}")
 
             current_state = trans_dict["state"]
             next_state = trans_dict["next"]
@@ -91,16 +111,27 @@ class Parser:
                     f"en 'read' ({len(read_symbols)}) y 'write' ({len(write_symbols)})."
                 )
 
-            for read_sym, write_sym in zip(read_symbols, write_symbols):
-                transitions.append(
-                    Transition(
-                        current_state=current_state,
-                        read_symbol=read_sym,
-                        write_symbol=write_sym,
-                        move=move,
-                        next_state=next_state,
-                    )
+            transitions.extend(
+                Transition(
+                    current_state=current_state,
+                    read_symbol=read_sym,
+                    write_symbol=write_sym,
+                    move=move,
+                    next_state=next_state,
                 )
+                for read_sym, write_sym in zip(read_symbols, write_symbols)
+            )
+
+            # Detectamos (estado, simbolo) duplicados aqui mismo: si add no
+            # agrando el conjunto, el par ya existia (una sola operacion por par).
+            for read_sym in read_symbols:
+                seen_len = len(seen)
+                seen.add((current_state, read_sym))
+                if len(seen) == seen_len:
+                    raise ValueError(
+                        f"La transición #{idx} repite el par (estado, símbolo) "
+                        f"('{current_state}', '{read_sym}')."
+                    )
 
         return transitions
 
@@ -113,4 +144,10 @@ class Parser:
             if not all(isinstance(s, str) for s in value):
                 raise ValueError(f"Todos los elementos de '{field_name}' deben ser strings.")
             return value
-        raise ValueError(f"'{field_name}' debe ser un string o una lista de strings.")
\ No newline at end of file
+        raise ValueError(f"'{field_name}' debe ser un string o una lista de strings.")
+
+
+# Cada (ruta, mtime) se parsea una sola vez; load_from_file entrega copias de esta MachineConfig.
+@lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int) -> MachineConfig:
+    return Parser._load_uncached(Path(path))
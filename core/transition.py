@@ -8,7 +8,7 @@ from dataclasses import dataclass
 _VALID_MOVES = {"L", "R", "S"}
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Transition:
     """
     Representa una regla de transicion determinista de la maquina.
@@ -41,9 +41,9 @@ class Transition:
 
     def signature(self) -> tuple[str, str]:
         """
-        Devuelve la llave que usa la maquina para buscar esta transicion.
+        Devuelve el par (current_state, read_symbol) que identifica esta transicion.
 
-        La maquina guarda un diccionario y se retorna la tupla:
-            (current_state, read_symbol) -> Transition
+        La maquina guarda un diccionario anidado con ese par:
+            current_state -> read_symbol -> Transition
         """
         return (self.current_state, self.read_symbol)
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""Pruebas del loop generado por maquina contra el kernel generico."""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "core"))
+
+from machine import Machine, _run_core  # noqa: E402
+from machine_config import MachineConfig  # noqa: E402
+from transition import Transition  # noqa: E402
+
+# Limites chicos y no positivos: ahi es donde se separaban ambos loops
+# (sin None, porque hay maquinas que nunca se detienen)
+LIMITS = [-1, 0, 1, 2, 3, 50]
+
+
+def _run_both(machine: Machine, input_string: str, max_steps, record_history: bool):
+    """Corre la misma entrada con el loop generado y con _run_core."""
+    specialized_core = machine._specialized_core(record_history)
+    state_id = machine._state_index[machine._config.initial_state]
+
+    tape, head_index, _ = machine._initialize_tape(input_string)
+    specialized = specialized_core(tape, head_index, state_id, max_steps)
+
+    tape, head_index, _ = machine._initialize_tape(input_string)
+    generic = _run_core(
+        tape,
+        head_index,
+        state_id,
+        machine._next_state_ids,
+        machine._write_symbol_ids,
+        machine._move_deltas,
+        machine._accept_mask,
+        len(machine._symbols),
+        machine._blank_padding(1),
+        max_steps,
+        record_history,
+    )
+    return specialized, generic
+
+
+def _config(transitions, *, tape_alphabet=("a", "X", "B"), blank_symbol="B") -> MachineConfig:
+    """MachineConfig chica con estados q0, q1 y qf (de aceptacion)."""
+    return MachineConfig(
+        states=["q0", "q1", "qf"],
+        input_alphabet=["a"],
+        tape_alphabet=list(tape_alphabet),
+        initial_state="q0",
+        accept_states=["qf"],
+        transitions=[Transition(*t) for t in transitions],
+        blank_symbol=blank_symbol,
+    )
+
+
+def _ids(history):
+    return [(d.state, d.tape, d.head_position) for d in history]
+
+
+class MachineRunTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Acepta exactamente la cadena "a"
+        self.machine = Machine(
+            _config([("q0", "a", "a", "R", "q1"), ("q1", "B", "B", "S", "qf")])
+        )
+
+    def test_run_without_history_returns_only_the_verdict(self) -> None:
+        for input_string, accepted in [("a", True), ("", False), ("aa", False)]:
+            with self.subTest(input=input_string):
+                self.assertEqual(
+                    self.machine.run(input_string, record_history=False), (None, accepted)
+                )
+                self.assertEqual(self.machine.accepts(input_string), accepted)
+                self.assertEqual(self.machine.run(input_string)[1], accepted)
+
+    def test_history_replays_instant_descriptions(self) -> None:
+        history, accepted = self.machine.run("a")
+        self.assertTrue(accepted)
+        self.assertEqual(len(history), 3)
+        self.assertEqual(_ids(history), [("q0", "a", 0), ("q1", "aB", 1), ("qf", "aB", 1)])
+        # Se puede iterar mas de una vez
+        self.assertEqual(_ids(history), _ids(history))
+
+    def test_history_when_head_walks_left_of_the_input(self) -> None:
+        transitions = [("q0", "a", "X", "L", "q1"), ("q1", "B", "B", "L", "qf")]
+        history, accepted = Machine(_config(transitions)).run("a")
+        self.assertTrue(accepted)
+        self.assertEqual(
+            _ids(history), [("q0", "a", 0), ("q1", "BX", 0), ("qf", "BBX", 0)]
+        )
+
+        # Mismo recorrido con un blank de varios caracteres (sin translate)
+        transitions = [("q0", "a", "X", "L", "q1"), ("q1", "BL", "BL", "L", "qf")]
+        config = _config(transitions, tape_alphabet=("a", "X", "BL"), blank_symbol="BL")
+        history, _ = Machine(config).run("a")
+        self.assertEqual(
+            _ids(history), [("q0", "a", 0), ("q1", "BLX", 0), ("qf", "BLBLX", 0)]
+        )
+
+    def test_input_outside_the_alphabet_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.machine.run("X")
+
+
+class SpecializedCoreTest(unittest.TestCase):
+    def assert_same_runs(self, machine: Machine, inputs) -> None:
+        self.assertIsNotNone(machine._specialized_core(True))
+        for input_string in inputs:
+            for limit in LIMITS:
+                for record_history in (True, False):
+                    with self.subTest(input=input_string, limit=limit, history=record_history):
+                        specialized, generic = _run_both(
+                            machine, input_string, limit, record_history
+                        )
+                        self.assertEqual(specialized, generic)
+
+    def test_infinite_loop_stops_at_small_limits(self) -> None:
+        # Nunca acepta: q0 y q1 se alternan moviendose a la derecha para siempre
+        config = MachineConfig(
+            states=["q0", "q1", "qf"],
+            input_alphabet=["a"],
+            tape_alphabet=["a", "B"],
+            initial_state="q0",
+            accept_states=["qf"],
+            transitions=[
+                Transition("q0", "a", "a", "R", "q1"),
+                Transition("q0", "B", "B", "R", "q1"),
+                Transition("q1", "a", "a", "R", "q0"),
+                Transition("q1", "B", "B", "R", "q0"),
+            ],
+        )
+        self.assert_same_runs(Machine(config), ["", "a", "aaa"])
+
+        # Con limite 0 ambos loops cortan despues del primer paso
+        _, generic = _run_both(Machine(config), "a", 0, True)
+        self.assertEqual(generic[1], [0, 1])
+
+    def test_many_transitions_per_state_use_the_table(self) -> None:
+        # Con muchas ramas por estado el if/elif es mas lento que _run_core
+        symbols = [f"s{i}" for i in range(20)] + ["B"]
+        config = MachineConfig(
+            states=["q0", "qf"],
+            input_alphabet=[],
+            tape_alphabet=symbols,
+            initial_state="q0",
+            accept_states=["qf"],
+            transitions=[Transition("q0", symbol, symbol, "R", "q0") for symbol in symbols],
+        )
+        machine = Machine(config)
+        self.assertIsNone(machine._specialized_core(True))
+        self.assertIsNone(machine._specialized_core(False))
+
+    def test_random_machines(self) -> None:
+        rnd = random.Random(0)
+        symbols = ["a", "b", "X", "B"]
+        for _ in range(200):
+            states = [f"q{i}" for i in range(rnd.randint(1, 4))]
+            transitions = [
+                Transition(state, symbol, rnd.choice(symbols), rnd.choice("LRS"), rnd.choice(states))
+                for state in states
+                for symbol in symbols
+                if rnd.random() < 0.8
+            ]
+            if not transitions:
+                continue
+            config = MachineConfig(
+                states=states,
+                input_alphabet=["a", "b"],
+                tape_alphabet=symbols,
+                initial_state=states[0],
+                accept_states=rnd.sample(states, rnd.randint(0, len(states))),
+                transitions=transitions,
+            )
+            inputs = ["".join(rnd.choice("ab") for _ in range(rnd.randint(0, 5))) for _ in range(3)]
+            self.assert_same_runs(Machine(config), inputs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Pruebas de la carga de MachineConfig desde YAML."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "core"))
+
+from parser import Parser  # noqa: E402
+
+MT_YAML = """\
+mt:
+  states: [q0, q1, q_accept]
+  input_alphabet: [a]
+  tape_alphabet: [a, B]
+  initial_state: q0
+  accept_states: [q_accept]
+  blank_symbol: B
+
+  transitions:
+    - state: q0
+      read: a
+      write: a
+      move: R
+      next: q1
+{extra}
+    - state: q1
+      read: B
+      write: B
+      move: S
+      next: q_accept
+
+inputs:
+  - "a"
+  - ""
+"""
+
+DUPLICATE_TRANSITION = """\
+    - state: q0
+      read: [B, a]
+      write: [B, a]
+      move: S
+      next: q1
+"""
+
+
+class ParserTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+
+    def _write(self, text: str) -> Path:
+        path = Path(self._tmpdir.name) / "mt.yaml"
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_load_from_file(self) -> None:
+        config = Parser.load_from_file(self._write(MT_YAML.format(extra="")))
+        self.assertEqual(config.states, ["q0", "q1", "q_accept"])
+        self.assertEqual(len(config.transitions), 2)
+        self.assertEqual(config.inputs, ["a", ""])
+
+    def test_duplicate_state_symbol_pair_is_rejected(self) -> None:
+        path = self._write(MT_YAML.format(extra=DUPLICATE_TRANSITION))
+        with self.assertRaisesRegex(ValueError, r"\('q0', 'a'\)"):
+            Parser.load_from_file(path)
+
+    def test_cache_hit_returns_an_independent_copy(self) -> None:
+        path = self._write(MT_YAML.format(extra=""))
+        first = Parser.load_from_file(path)
+        first.inputs.append("aa")
+        first.states.append("q_extra")
+        first.transitions.clear()
+
+        second = Parser.load_from_file(path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.inputs, ["a", ""])
+        self.assertEqual(second.states, ["q0", "q1", "q_accept"])
+        self.assertEqual(len(second.transitions), 2)
+
+    def test_missing_file(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            Parser.load_from_file(Path(self._tmpdir.name) / "missing.yaml")
+
+
+if __name__ == "__main__":
+    unittest.main()